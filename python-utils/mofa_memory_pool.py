@@ -4,44 +4,125 @@
 核心优化：动态扩容、线程安全、内存监控、配置持久化、完整异常处理
 """
 from mofa_nebula import MemoryPoolConfig, MemoryBlockType, SceneType
+import atexit
+import functools
+import hashlib
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 import threading
 import time
 import json
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict
+import types
+import weakref
+from collections import deque
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from enum import Enum
 
+try:
+    import orjson  # 可选依赖：C实现的JSON解析，速度明显快于标准库
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # 配置日志（增强日志配置，支持日志轮转）
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.handlers.RotatingFileHandler(
-            'memory_pool.log',
-            encoding='utf-8',
-            mode='a',
-            maxBytes=10 * 1024 * 1024,  # 10MB轮转
-            backupCount=5
-        )
-    ]
+# 实际输出由QueueListener后台线程完成，调用方只做入队，避免热路径上的同步写盘
+_log_formatter = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+_rotating_handler = logging.handlers.RotatingFileHandler(
+    'memory_pool.log',
+    encoding='utf-8',
+    mode='a',
+    maxBytes=10 * 1024 * 1024,  # 10MB轮转
+    backupCount=5
 )
+_rotating_handler.setFormatter(_log_formatter)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _stream_handler, _rotating_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # 退出时刷出队列中剩余日志
+
+# 与logging.basicConfig一致：根logger已有handler时不重复配置
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _root_logger.setLevel(logging.INFO)
 logger = logging.getLogger("MofaMemoryPool")
 
-@dataclass
 class MemoryPoolMetrics:
-    """内存池性能指标"""
-    total_allocations: int = 0
-    total_deallocations: int = 0
-    allocation_failures: int = 0
-    peak_memory_usage: int = 0
-    startup_time: float = 0.0
+    """
+    内存池性能指标
+    使用__slots__去掉实例__dict__，降低内存占用并加快属性访问
+    """
+    __slots__ = ('total_allocations', 'total_deallocations', 'allocation_failures',
+                 'peak_memory_usage', 'startup_time')
+
+    def __init__(self, total_allocations: int = 0, total_deallocations: int = 0,
+                 allocation_failures: int = 0, peak_memory_usage: int = 0,
+                 startup_time: float = 0.0) -> None:
+        self.total_allocations = total_allocations
+        self.total_deallocations = total_deallocations
+        self.allocation_failures = allocation_failures
+        self.peak_memory_usage = peak_memory_usage
+        self.startup_time = startup_time
+
+    def __repr__(self) -> str:
+        return (f"MemoryPoolMetrics(total_allocations={self.total_allocations}, "
+                f"total_deallocations={self.total_deallocations}, "
+                f"allocation_failures={self.allocation_failures}, "
+                f"peak_memory_usage={self.peak_memory_usage}, "
+                f"startup_time={self.startup_time})")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # 与dataclass(eq=True)一致：可变对象不可哈希
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典，便于持久化"""
-        return asdict(self)
+        return {
+            'total_allocations': self.total_allocations,
+            'total_deallocations': self.total_deallocations,
+            'allocation_failures': self.allocation_failures,
+            'peak_memory_usage': self.peak_memory_usage,
+            'startup_time': self.startup_time,
+        }
+
+# 每个(场景, 块类型)线程本地空闲链表的缓存上限，超出后归还SDK
+_FREELIST_CAP = 256
+
+class _ThreadFreelists:
+    """
+    线程本地空闲链表容器：lists为(场景, 块类型) -> (所属内存池, 空闲块deque)
+    hits/sdk_allocs/sdk_deallocs统计本线程空闲链表命中次数与实际SDK申请/归还次数
+    """
+    __slots__ = ('lists', 'hits', 'sdk_allocs', 'sdk_deallocs', '__weakref__')
+
+    def __init__(self) -> None:
+        self.lists: Dict[Tuple[SceneType, MemoryBlockType], Tuple[MemoryPoolConfig, deque]] = {}
+        self.hits = 0
+        self.sdk_allocs = 0
+        self.sdk_deallocs = 0
+
+def _drain_freelist(pool: MemoryPoolConfig, freelist: deque) -> int:
+    """将空闲链表中的缓存块全部归还所属内存池，返回归还块数"""
+    drained = 0
+    while True:
+        try:
+            handle = freelist.pop()
+        except IndexError:  # 已清空（可能被其他线程并发清空）
+            return drained
+        pool.deallocate(handle)
+        drained += 1
 
 class MemoryPoolManager:
     """
@@ -53,50 +134,178 @@ class MemoryPoolManager:
     _lock = threading.Lock()
 
     def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._pools = {}  # 场景->内存池实例
-                cls._instance._metrics = {}  # 场景->性能指标
-                cls._instance._stop_monitor = False  # 监控线程退出标志
-                cls._instance._monitor_threads = []  # 监控线程列表
-            return cls._instance
+        # 双重检查锁：实例创建后读路径不再加锁
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._pools = {}  # 场景->内存池实例
+                    instance._metrics = {}  # 场景->性能指标
+                    instance._stop_event = threading.Event()  # 监控线程退出事件
+                    instance._monitor_threads = []  # 外部登记的监控线程（兼容add_monitor_thread）
+                    instance._global_monitor = None  # 全局监控线程（首次注册时启动）
+                    instance._freelists = threading.local()  # 线程本地空闲块缓存
+                    instance._freelist_registry = {}  # 所有线程的空闲链表（便于跨线程归还）
+                    instance._freelist_lock = threading.Lock()
+                    cls._instance = instance
+        return cls._instance
 
     def register_pool(self, scene_type: SceneType, pool: MemoryPoolConfig) -> None:
         """注册内存池实例（线程安全）"""
         with self._lock:
+            old_pool = self._pools.get(scene_type)
             self._pools[scene_type] = pool
+            if old_pool is not None and old_pool is not pool:
+                # 重新注册时把旧池的缓存块归还旧池，避免旧句柄被新池分配出去
+                self.flush_freelists(scene_type)
             self._metrics[scene_type] = MemoryPoolMetrics()
             self._metrics[scene_type].startup_time = time.time()
-            logger.debug(f"场景{scene_type.name}内存池已注册")
+            if self._global_monitor is None:
+                self._start_global_monitor()
+            logger.debug("场景%s内存池已注册", scene_type.name)
 
     def get_pool(self, scene_type: SceneType) -> Optional[MemoryPoolConfig]:
-        """获取内存池实例（线程安全）"""
-        with self._lock:
-            return self._pools.get(scene_type)
+        """获取内存池实例（无锁读：注册只增不删，dict.get在GIL下原子）"""
+        pools = self._pools
+        return pools.get(scene_type)
 
     def get_metrics(self, scene_type: SceneType) -> Optional[MemoryPoolMetrics]:
-        """获取性能指标（线程安全）"""
-        with self._lock:
-            return self._metrics.get(scene_type)
+        """获取性能指标（无锁读：注册只增不删，dict.get在GIL下原子）"""
+        metrics = self._metrics
+        return metrics.get(scene_type)
+
+    def _get_freelist(self, scene_type: SceneType, block_type: MemoryBlockType,
+                      pool: MemoryPoolConfig) -> Tuple[_ThreadFreelists, deque]:
+        """获取当前线程的空闲链表容器及(场景, 块类型)空闲链表（线程本地，无需加锁）；所属内存池变化时先归还旧块"""
+        local = self._freelists
+        holder = getattr(local, 'holder', None)
+        if holder is None:
+            holder = local.holder = _ThreadFreelists()
+            with self._freelist_lock:
+                self._freelist_registry[id(holder.lists)] = holder.lists
+            # 线程退出、容器被回收时把该线程缓存的块归还SDK
+            weakref.finalize(holder, self._release_thread_freelists, holder.lists)
+        key = (scene_type, block_type)
+        entry = holder.lists.get(key)
+        if entry is None or entry[0] is not pool:
+            if entry is not None:
+                _drain_freelist(*entry)
+            entry = holder.lists[key] = (pool, deque())
+        return holder, entry[1]
+
+    def _release_thread_freelists(self, lists: Dict) -> None:
+        """线程退出回调：归还该线程缓存的全部内存块并注销"""
+        with self._freelist_lock:
+            self._freelist_registry.pop(id(lists), None)
+        for pool, freelist in list(lists.values()):
+            try:
+                _drain_freelist(pool, freelist)
+            except Exception as e:
+                logger.error(f"线程退出时归还缓存内存块失败: {e}", exc_info=True)
+
+    def get_block(self, scene_type: SceneType, block_type: MemoryBlockType) -> Any:
+        """申请内存块：优先复用线程本地空闲块，为空时才向SDK申请；场景未注册时返回None"""
+        pool = self._pools.get(scene_type)
+        if pool is None:
+            return None
+        holder, freelist = self._get_freelist(scene_type, block_type, pool)
+        if freelist:
+            try:
+                handle = freelist.pop()
+            except IndexError:  # 被其他线程的flush_freelists并发清空
+                pass
+            else:
+                holder.hits += 1
+                return handle
+        holder.sdk_allocs += 1
+        return pool.allocate(block_type=block_type)
+
+    def return_block(self, scene_type: SceneType, block_type: MemoryBlockType, handle: Any) -> None:
+        """归还内存块：缓存到线程本地空闲链表，超过上限时真正归还SDK"""
+        pool = self._pools.get(scene_type)
+        if pool is None:
+            raise MemoryPoolError(f"场景{scene_type.name}未注册内存池，无法归还内存块")
+        holder, freelist = self._get_freelist(scene_type, block_type, pool)
+        if len(freelist) < _FREELIST_CAP:
+            freelist.append(handle)
+        else:
+            holder.sdk_deallocs += 1
+            pool.deallocate(handle)
+
+    def freelist_stats(self) -> Tuple[int, int, int]:
+        """当前线程空闲链表统计：(缓存命中次数, SDK申请次数, SDK归还次数)，不含flush_freelists归还的块"""
+        holder = getattr(self._freelists, 'holder', None)
+        if holder is None:
+            return 0, 0, 0
+        return holder.hits, holder.sdk_allocs, holder.sdk_deallocs
+
+    def flush_freelists(self, scene_type: Optional[SceneType] = None) -> int:
+        """将所有线程缓存的空闲块归还各自所属内存池（可按场景过滤），返回归还块数"""
+        with self._freelist_lock:
+            all_lists = list(self._freelist_registry.values())
+        flushed = 0
+        for lists in all_lists:
+            for (scene, _), (pool, freelist) in list(lists.items()):
+                if scene_type is None or scene == scene_type:
+                    flushed += _drain_freelist(pool, freelist)
+        return flushed
 
     def stop_all_monitors(self) -> None:
         """停止所有监控线程（优雅退出）"""
         with self._lock:
-            self._stop_monitor = True
+            self._stop_event.set()
         logger.info("开始停止所有内存池监控线程...")
+        if self._global_monitor is not None and self._global_monitor.is_alive():
+            self._global_monitor.join(timeout=5)
+            logger.debug("监控线程%s已停止", self._global_monitor.name)
+        self._global_monitor = None
         for thread in self._monitor_threads:
             if thread.is_alive():
                 thread.join(timeout=5)
-                logger.debug(f"监控线程{thread.name}已停止")
+                logger.debug("监控线程%s已停止", thread.name)
         self._monitor_threads.clear()
         logger.info("所有监控线程已停止")
 
     def add_monitor_thread(self, thread: threading.Thread) -> None:
-        """添加监控线程到管理列表"""
+        """添加监控线程到管理列表（仅为兼容外部调用保留，内置监控已由全局监控线程统一负责）"""
         with self._lock:
             self._monitor_threads.append(thread)
 
+    def _start_global_monitor(self) -> None:
+        """启动全局监控线程（调用方需持有_lock），所有场景共用一个线程"""
+        thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        thread.name = "MemoryPoolMonitor"
+        thread.start()
+        self._global_monitor = thread
+        logger.debug("全局监控线程已启动: %s", thread.name)
+
+    def _monitor_loop(self) -> None:
+        """全局监控循环：每个周期依次采集所有已注册内存池（支持优雅退出）"""
+        stop_event = self._stop_event
+        pools = self._pools
+        metrics = self._metrics
+        # 启动后立即采集一次，之后每5分钟采集一次（收到退出事件时立即返回）
+        while True:
+            try:
+                for scene_type, pool in list(pools.items()):
+                    _sample_pool_usage(scene_type, pool, metrics.get(scene_type))
+                interval = 300
+            except Exception as e:
+                logger.error(f"内存池监控线程异常: {e}", exc_info=True)
+                interval = 60  # 异常后延迟1分钟继续
+            if stop_event.wait(interval):
+                break
+
+# 全局管理器实例（模块内统一使用，避免重复进入__new__）
+MANAGER = MemoryPoolManager()
+
+# 场景默认内存上限（外部配置键为 <场景名>_TOTAL_MEMORY）
+_SCENE_DEFAULT_MEMORY: Dict[SceneType, int] = {
+    SceneType.PUBLIC_SERVICE_SCREEN: 512 << 20,  # 512MB
+    SceneType.VEHICLE: 1 << 30,  # 1GB
+    SceneType.VIRTUAL_IP: 2 << 30,  # 2GB
+}
+
 def init_scene_memory_pool(scene_type: SceneType, config_file: Optional[str] = None) -> MemoryPoolConfig:
     """
     初始化场景化内存池（最终增强版）
@@ -118,22 +327,12 @@ def init_scene_memory_pool(scene_type: SceneType, config_file: Optional[str] = N
         external_config = _load_external_config(config_file) if config_file else {}
 
         # 1. 场景内存上限配置（支持外部配置覆盖默认值）
-        scene_memory_config: Dict[SceneType, int] = {
-            SceneType.PUBLIC_SERVICE_SCREEN: external_config.get(
-                'PUBLIC_SERVICE_SCREEN_TOTAL_MEMORY', 512 * 1024 * 1024
-            ),
-            SceneType.VEHICLE: external_config.get(
-                'VEHICLE_TOTAL_MEMORY', 1024 * 1024 * 1024
-            ),
-            SceneType.VIRTUAL_IP: external_config.get(
-                'VIRTUAL_IP_TOTAL_MEMORY', 2048 * 1024 * 1024
-            )
-        }
-
-        if scene_type not in scene_memory_config:
+        if scene_type not in _SCENE_DEFAULT_MEMORY:
             raise ValueError(f"不支持的场景类型: {scene_type}")
 
-        total_memory = scene_memory_config[scene_type]
+        total_memory = external_config.get(
+            f'{scene_type.name}_TOTAL_MEMORY', _SCENE_DEFAULT_MEMORY[scene_type]
+        )
         logger.info(f"开始初始化 {scene_type.name} 场景内存池，总内存: {total_memory/(1024 * 1024):.0f}MB")
 
         # 2. 创建内存池实例（带超时保护）
@@ -150,14 +349,14 @@ def init_scene_memory_pool(scene_type: SceneType, config_file: Optional[str] = N
             raise MemoryPoolError("内存池配置验证失败")
 
         # 6. 注册到管理器
-        manager = MemoryPoolManager()
-        manager.register_pool(scene_type, pool)
+        MANAGER.register_pool(scene_type, pool)
 
         # 7. 启动后台监控线程
         _start_background_monitoring(pool, scene_type)
 
         logger.info(f"✅ {scene_type.name} 场景内存池初始化成功")
-        logger.debug(f"内存池详细配置: {pool.get_block_config()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("内存池详细配置: %s", pool.get_block_config())
 
         return pool
 
@@ -168,15 +367,14 @@ def init_scene_memory_pool(scene_type: SceneType, config_file: Optional[str] = N
 def _load_external_config(config_file: str) -> Dict[str, Any]:
     """加载外部JSON配置文件（增强类型校验）"""
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        # 类型校验：确保内存大小为整型
-        for key, value in config.items():
-            if "MEMORY" in key or "SIZE" in key or "COUNT" in key:
-                if not isinstance(value, int):
-                    logger.warning(f"配置项{key}值{value}非整型，将转换为整型")
-                    config[key] = int(value) if str(value).isdigit() else 0
-        return config
+        with open(config_file, 'rb') as f:
+            config = _json_loads(f.read())
+        # 类型校验：确保内存大小为整型（单次遍历完成转换）
+        return {
+            key: (_coerce_int_config(key, value)
+                  if not isinstance(value, int) and _is_int_config_key(key) else value)
+            for key, value in config.items()
+        }
     except json.JSONDecodeError as e:
         logger.error(f"配置文件解析失败: {e}", exc_info=True)
         raise MemoryPoolError(f"配置文件JSON格式错误: {e}")
@@ -187,143 +385,161 @@ def _load_external_config(config_file: str) -> Dict[str, Any]:
         logger.warning(f"外部配置文件加载失败，使用默认配置: {e}")
         return {}
 
-def _create_pool_with_timeout(total_memory: int, timeout: int = 30) -> MemoryPoolConfig:
-    """带超时的内存池创建（避免SDK阻塞）"""
-    from queue import Queue
-
-    result_queue = Queue(maxsize=1)
-
-    def create_pool():
-        """子线程创建内存池"""
+def _is_int_config_key(key: str) -> bool:
+    """判断配置项是否为整型字段（内存大小、块大小、块数量）"""
+    return "MEMORY" in key or "SIZE" in key or "COUNT" in key
+
+def _coerce_int_config(key: str, value: Any) -> int:
+    """将非整型配置值转换为整型（无法转换时取0）"""
+    logger.warning(f"配置项{key}值{value}非整型，将转换为整型")
+    return int(value) if str(value).isdigit() else 0
+
+# 内存池创建任务队列及常驻守护工作线程（复用线程，SDK调用卡死时不阻塞解释器退出）
+_pool_create_lock = threading.Lock()
+_pool_create_jobs: "Optional[queue.SimpleQueue]" = None
+
+def _pool_create_worker(jobs: "queue.SimpleQueue") -> None:
+    """常驻守护线程：依次执行内存池创建任务，收到None时退出"""
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        fn, kwargs, done, cell = job
         try:
-            pool = MemoryPoolConfig(total_memory=total_memory)
-            result_queue.put(pool)
+            cell[0] = fn(**kwargs)
         except Exception as e:
-            result_queue.put(e)
-
-    # 启动创建线程
-    create_thread = threading.Thread(target=create_pool, daemon=True)
-    create_thread.start()
-    create_thread.join(timeout=timeout)
+            cell[0] = e
+        finally:
+            done.set()
+
+def _get_pool_create_jobs() -> "queue.SimpleQueue":
+    """获取创建任务队列，工作线程不存在时启动"""
+    global _pool_create_jobs
+    with _pool_create_lock:
+        if _pool_create_jobs is None:
+            _pool_create_jobs = queue.SimpleQueue()
+            threading.Thread(target=_pool_create_worker, args=(_pool_create_jobs,),
+                             name="PoolCreate", daemon=True).start()
+        return _pool_create_jobs
+
+def _retire_pool_create_worker(jobs: "queue.SimpleQueue") -> None:
+    """工作线程卡在SDK调用中：后续任务改由新线程执行，旧线程解除阻塞后自行退出"""
+    global _pool_create_jobs
+    with _pool_create_lock:
+        if _pool_create_jobs is jobs:
+            _pool_create_jobs = None
+    jobs.put(None)
 
-    # 处理结果
-    if result_queue.empty():
+def _create_pool_with_timeout(total_memory: int, timeout: int = 30) -> MemoryPoolConfig:
+    """带超时的内存池创建（避免SDK阻塞），工作线程中的异常原样抛出"""
+    jobs = _get_pool_create_jobs()
+    # Event + 单元素列表传递结果：只需一次锁等待，比Queue/Future更轻
+    done = threading.Event()
+    cell: List[Any] = [None]
+    jobs.put((MemoryPoolConfig, {'total_memory': total_memory}, done, cell))
+    if not done.wait(timeout):
+        _retire_pool_create_worker(jobs)
         raise MemoryPoolError(f"内存池创建超时（{timeout}秒）")
-    result = result_queue.get()
+    result = cell[0]
     if isinstance(result, Exception):
         raise result
     return result
 
+# 场景分级子池规格表：场景 -> (外部配置键前缀, ((块类型, 默认块大小, 默认块数量, 用途说明), ...))
+# 外部配置覆盖键为 <前缀>_<块类型名>_BLOCK_SIZE / <前缀>_<块类型名>_BLOCK_COUNT
+_BlockSpec = Tuple[MemoryBlockType, int, int, str]
+_SCENE_BLOCK_SPECS: Dict[SceneType, Tuple[str, Tuple[_BlockSpec, ...]]] = {
+    # 公共服务屏场景（嵌入式设备）
+    SceneType.PUBLIC_SERVICE_SCREEN: ('PS', (
+        (MemoryBlockType.LARGE, 64 << 20, 4, "存储静态3D数字人模型、高清纹理贴图"),
+        (MemoryBlockType.SMALL, 32 << 10, 1024, "存储实时交互指令、用户查询、设备状态"),
+        (MemoryBlockType.MEDIUM, 2 << 20, 32, "缓存动态内容、临时计算数据"),
+    )),
+    # 车载场景（动作帧缓存核心）
+    SceneType.VEHICLE: ('V', (
+        (MemoryBlockType.MEDIUM, 16 << 20, 32, "存储文生3D动作帧、实时渲染缓存"),
+        (MemoryBlockType.SMALL, 64 << 10, 512, "存储传感器数据、实时控制指令"),
+        (MemoryBlockType.LARGE, 128 << 20, 4, "存储高精地图数据、AI推理模型"),
+    )),
+    # 虚拟IP场景（4K纹理、高清资源）
+    SceneType.VIRTUAL_IP: ('VIP', (
+        (MemoryBlockType.LARGE, 256 << 20, 6, "存储4K纹理、高清模型资源、动作数据"),
+        (MemoryBlockType.MEDIUM, 8 << 20, 32, "缓存动画帧、物理计算中间结果"),
+        (MemoryBlockType.SMALL, 128 << 10, 256, "处理用户交互数据、网络通信包"),
+    )),
+}
+
+# 通用场景配置（兜底方案）
+_GENERIC_BLOCK_SPECS: Tuple[str, Tuple[_BlockSpec, ...]] = ('GEN', (
+    (MemoryBlockType.MEDIUM, 32 << 20, 8, "通用场景默认中对象池"),
+))
+
 def _configure_scene_pools(pool: MemoryPoolConfig, scene_type: SceneType, external_config: Dict[str, Any]) -> None:
     """配置场景化内存池（动态参数版）"""
-    config_strategies = {
-        SceneType.PUBLIC_SERVICE_SCREEN: _configure_public_service_screen,
-        SceneType.VEHICLE: _configure_vehicle_screen,
-        SceneType.VIRTUAL_IP: _configure_virtual_ip
-    }
-
-    if scene_type in config_strategies:
-        config_strategies[scene_type](pool, external_config)
-    else:
+    scene_specs = _SCENE_BLOCK_SPECS.get(scene_type)
+    if scene_specs is None:
         logger.warning(f"未找到场景 {scene_type} 的配置策略，使用通用配置")
-        _configure_generic_pool(pool, external_config)
-
-def _configure_public_service_screen(pool: MemoryPoolConfig, external_config: Dict[str, Any]) -> None:
-    """配置公共服务屏场景（嵌入式设备）"""
-    # 大对象池：3D模型、纹理数据
-    pool.add_block(
-        block_type=MemoryBlockType.LARGE,
-        block_size=external_config.get('PS_LARGE_BLOCK_SIZE', 64 * 1024 * 1024),
-        block_count=external_config.get('PS_LARGE_BLOCK_COUNT', 4),
-        description="存储静态3D数字人模型、高清纹理贴图"
-    )
-    # 小对象池：交互指令、设备状态
-    pool.add_block(
-        block_type=MemoryBlockType.SMALL,
-        block_size=external_config.get('PS_SMALL_BLOCK_SIZE', 32 * 1024),
-        block_count=external_config.get('PS_SMALL_BLOCK_COUNT', 1024),
-        description="存储实时交互指令、用户查询、设备状态"
-    )
-    # 中对象池：临时数据缓存
-    pool.add_block(
-        block_type=MemoryBlockType.MEDIUM,
-        block_size=external_config.get('PS_MEDIUM_BLOCK_SIZE', 2 * 1024 * 1024),
-        block_count=external_config.get('PS_MEDIUM_BLOCK_COUNT', 32),
-        description="缓存动态内容、临时计算数据"
-    )
-
-def _configure_vehicle_screen(pool: MemoryPoolConfig, external_config: Dict[str, Any]) -> None:
-    """配置车载场景（动作帧缓存核心）"""
-    # 中对象池：动作帧、渲染缓存
-    pool.add_block(
-        block_type=MemoryBlockType.MEDIUM,
-        block_size=external_config.get('V_MEDIUM_BLOCK_SIZE', 16 * 1024 * 1024),
-        block_count=external_config.get('V_MEDIUM_BLOCK_COUNT', 32),
-        description="存储文生3D动作帧、实时渲染缓存"
-    )
-    # 小对象池：传感器数据、控制指令
-    pool.add_block(
-        block_type=MemoryBlockType.SMALL,
-        block_size=external_config.get('V_SMALL_BLOCK_SIZE', 64 * 1024),
-        block_count=external_config.get('V_SMALL_BLOCK_COUNT', 512),
-        description="存储传感器数据、实时控制指令"
-    )
-    # 大对象池：高精地图、AI模型
-    pool.add_block(
-        block_type=MemoryBlockType.LARGE,
-        block_size=external_config.get('V_LARGE_BLOCK_SIZE', 128 * 1024 * 1024),
-        block_count=external_config.get('V_LARGE_BLOCK_COUNT', 4),
-        description="存储高精地图数据、AI推理模型"
-    )
-
-def _configure_virtual_ip(pool: MemoryPoolConfig, external_config: Dict[str, Any]) -> None:
-    """配置虚拟IP场景（4K纹理、高清资源）"""
-    # 大对象池：4K纹理、高清模型
-    pool.add_block(
-        block_type=MemoryBlockType.LARGE,
-        block_size=external_config.get('VIP_LARGE_BLOCK_SIZE', 256 * 1024 * 1024),
-        block_count=external_config.get('VIP_LARGE_BLOCK_COUNT', 6),
-        description="存储4K纹理、高清模型资源、动作数据"
-    )
-    # 中对象池：动画帧、计算中间结果
-    pool.add_block(
-        block_type=MemoryBlockType.MEDIUM,
-        block_size=external_config.get('VIP_MEDIUM_BLOCK_SIZE', 8 * 1024 * 1024),
-        block_count=external_config.get('VIP_MEDIUM_BLOCK_COUNT', 32),
-        description="缓存动画帧、物理计算中间结果"
-    )
-    # 小对象池：用户交互、网络数据
-    pool.add_block(
-        block_type=MemoryBlockType.SMALL,
-        block_size=external_config.get('VIP_SMALL_BLOCK_SIZE', 128 * 1024),
-        block_count=external_config.get('VIP_SMALL_BLOCK_COUNT', 256),
-        description="处理用户交互数据、网络通信包"
-    )
-
-def _configure_generic_pool(pool: MemoryPoolConfig, external_config: Dict[str, Any]) -> None:
-    """通用场景配置（兜底方案）"""
-    pool.add_block(
-        block_type=MemoryBlockType.MEDIUM,
-        block_size=external_config.get('GEN_MEDIUM_BLOCK_SIZE', 32 * 1024 * 1024),
-        block_count=external_config.get('GEN_MEDIUM_BLOCK_COUNT', 8),
-        description="通用场景默认中对象池"
-    )
+        scene_specs = _GENERIC_BLOCK_SPECS
+    _configure_scene(pool, scene_specs, external_config)
+
+def _configure_scene(pool: MemoryPoolConfig, scene_specs: Tuple[str, Tuple[_BlockSpec, ...]],
+                     external_config: Dict[str, Any]) -> None:
+    """按规格表添加子池，合并外部配置覆盖项；SDK支持add_blocks时一次提交"""
+    prefix, block_specs = scene_specs
+    if external_config:
+        specs = [
+            (block_type,
+             external_config.get(f'{prefix}_{block_type.name}_BLOCK_SIZE', block_size),
+             external_config.get(f'{prefix}_{block_type.name}_BLOCK_COUNT', block_count),
+             description)
+            for block_type, block_size, block_count, description in block_specs
+        ]
+    else:
+        specs = list(block_specs)
+
+    if hasattr(pool, 'add_blocks'):
+        pool.add_blocks(specs)
+    else:
+        add_block = pool.add_block
+        for spec in specs:
+            add_block(*spec)
+
+# 高级特性：(SDK方法名, 调用参数, 功能说明)
+_ADVANCED_FEATURES: Tuple[Tuple[str, Tuple[Any, ...], str], ...] = (
+    ('enable_memory_reuse', (), '内存复用'),
+    ('enable_fragmentation_cleanup', (0.1,), '碎片整理'),
+    ('enable_auto_expansion', (0.8,), '自动扩容'),  # 使用率80%时自动扩容
+)
+# 内存池类型 -> 高级特性支持情况（每个类型只探测一次）
+_CAPS_CACHE: Dict[type, Dict[str, bool]] = {}
+
+def _probe_capabilities(pool: MemoryPoolConfig) -> Dict[str, bool]:
+    """探测内存池类型支持的高级特性并缓存，不支持的特性仅在首次探测时告警"""
+    pool_type = type(pool)
+    caps = _CAPS_CACHE.get(pool_type)
+    if caps is None:
+        caps = {}
+        for feature, _, description in _ADVANCED_FEATURES:
+            try:
+                caps[feature] = hasattr(pool, feature)
+            except Exception as e:
+                logger.warning(f"⚠️ {description}功能探测失败: {e}", exc_info=True)
+                caps[feature] = False
+                continue
+            if not caps[feature]:
+                logger.warning(f"⚠️ SDK不支持{description}功能，跳过启用")
+        _CAPS_CACHE[pool_type] = caps
+    return caps
 
 def _enable_advanced_features(pool: MemoryPoolConfig) -> None:
     """启用高级特性（增强错误处理与兼容性）"""
-    advanced_features = [
-        ('enable_memory_reuse', [], '内存复用'),
-        ('enable_fragmentation_cleanup', [0.1], '碎片整理'),
-        ('enable_auto_expansion', [0.8], '自动扩容'),  # 使用率80%时自动扩容
-    ]
-
-    for feature, args, description in advanced_features:
+    caps = _probe_capabilities(pool)
+    for feature, args, description in _ADVANCED_FEATURES:
+        if not caps[feature]:
+            continue
         try:
-            if hasattr(pool, feature):
-                getattr(pool, feature)(*args)
-                logger.debug(f"✅ {description}功能启用成功")
-            else:
-                logger.warning(f"⚠️ SDK不支持{description}功能，跳过启用")
+            getattr(pool, feature)(*args)
+            logger.debug("✅ %s功能启用成功", description)
         except Exception as e:
             logger.warning(f"⚠️ {description}功能启用失败: {e}", exc_info=True)
 
@@ -332,13 +548,18 @@ def _validate_pool_config(pool: MemoryPoolConfig) -> bool:
     try:
         config: Any = pool.get_block_config()
         total_configured = 0
+        # 调试日志关闭时跳过逐块格式化
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        _debug = logger.debug
 
         # 处理字典类型配置
         if isinstance(config, dict):
             for block_key, block_info in config.items():
                 if isinstance(block_info, dict) and 'block_size' in block_info and 'block_count' in block_info:
                     total_configured += block_info['block_size'] * block_info['block_count']
-                    logger.debug(f"解析块{block_key}：大小{block_info['block_size']/1024/1024:.1f}MB，数量{block_info['block_count']}")
+                    if debug_enabled:
+                        _debug("解析块%s：大小%.1fMB，数量%d",
+                               block_key, block_info['block_size'] / 1048576, block_info['block_count'])
                 else:
                     logger.warning(f"内存块{block_key}配置格式异常，跳过统计: {block_info}")
         # 处理列表类型配置
@@ -346,7 +567,9 @@ def _validate_pool_config(pool: MemoryPoolConfig) -> bool:
             for idx, block_info in enumerate(config):
                 if isinstance(block_info, dict) and 'block_size' in block_info and 'block_count' in block_info:
                     total_configured += block_info['block_size'] * block_info['block_count']
-                    logger.debug(f"解析列表块{idx}：大小{block_info['block_size']/1024/1024:.1f}MB，数量{block_info['block_count']}")
+                    if debug_enabled:
+                        _debug("解析列表块%d：大小%.1fMB，数量%d",
+                               idx, block_info['block_size'] / 1048576, block_info['block_count'])
                 else:
                     logger.warning(f"列表内存块{idx}配置格式异常，跳过统计: {block_info}")
         # 不支持的配置格式
@@ -362,68 +585,135 @@ def _validate_pool_config(pool: MemoryPoolConfig) -> bool:
             logger.error("内存池未配置任何有效内存块")
             return False
 
-        logger.debug(f"配置验证通过，总配置内存{total_configured/1024/1024:.1f}MB，内存池总内存{pool.total_memory/1024/1024:.1f}MB")
+        if debug_enabled:
+            _debug("配置验证通过，总配置内存%.1fMB，内存池总内存%.1fMB",
+                   total_configured / 1048576, pool.total_memory / 1048576)
         return True
     except Exception as e:
         logger.error(f"配置验证异常: {e}", exc_info=True)
         return False
 
-def _start_background_monitoring(pool: MemoryPoolConfig, scene_type: SceneType) -> None:
-    """启动后台监控线程（支持优雅退出）"""
-    def monitor():
-        manager = MemoryPoolManager()
-        metrics = manager.get_metrics(scene_type)
-
-        while not manager._stop_monitor:
-            try:
-                # 监控内存使用情况（兼容SDK返回值）
-                if hasattr(pool, 'get_usage_stats'):
-                    stats = pool.get_usage_stats()
-                    if metrics and isinstance(stats, dict):
-                        current_usage = stats.get('used_memory', 0)
-                        metrics.peak_memory_usage = max(metrics.peak_memory_usage, current_usage)
-                        logger.debug(f"场景{scene_type.name}内存峰值: {metrics.peak_memory_usage/1024/1024:.1f}MB")
-
-                # 每5分钟采集一次数据
-                time.sleep(300)
+def _sample_pool_usage(scene_type: SceneType, pool: MemoryPoolConfig,
+                       metrics: Optional[MemoryPoolMetrics]) -> None:
+    """采集单个内存池使用情况并更新峰值（兼容SDK返回值）"""
+    if hasattr(pool, 'get_usage_stats'):
+        stats = pool.get_usage_stats()
+        if metrics and isinstance(stats, dict):
+            current_usage = stats.get('used_memory', 0)
+            metrics.peak_memory_usage = max(metrics.peak_memory_usage, current_usage)
+            logger.debug("场景%s内存峰值: %.1fMB", scene_type.name, metrics.peak_memory_usage / 1048576)
 
-            except Exception as e:
-                logger.error(f"场景{scene_type.name}监控线程异常: {e}", exc_info=True)
-                time.sleep(60)  # 异常后延迟1分钟继续
+def _start_background_monitoring(pool: MemoryPoolConfig, scene_type: SceneType) -> None:
+    """登记后台监控（由管理器的全局监控线程统一采集，不再为每个场景单独起线程），并立即采集一次"""
+    try:
+        _sample_pool_usage(scene_type, pool, MANAGER.get_metrics(scene_type))
+    except Exception as e:
+        logger.error(f"场景{scene_type.name}内存监控采集异常: {e}", exc_info=True)
+    logger.debug("场景%s已加入全局内存监控", scene_type.name)
+
+# 环形复用测试中保持在用的块数量（模拟业务持有内存块一段时间）
+_RING_SIZE = 64
+# 混合尺寸测试的块类型轮换及环大小（大对象块数量少，不参与轮换）
+_MIXED_BLOCK_TYPES = (MemoryBlockType.SMALL, MemoryBlockType.MEDIUM)
+_MIXED_RING_SIZE = 16
+
+def _run_ring_pass(alloc: Callable[[MemoryBlockType], Any], dealloc: Callable[[MemoryBlockType, Any], None],
+                   block_types: Tuple[MemoryBlockType, ...], ring_size: int,
+                   iterations: int) -> Dict[MemoryBlockType, List[int]]:
+    """
+    环形复用分配测试：保持ring_size个块在用，每次释放最旧的块后申请同类型新块
+    环中第j个槽位固定使用block_types[j % len(block_types)]
+    :param alloc: 申请函数 alloc(块类型) -> 内存块
+    :param dealloc: 释放函数 dealloc(块类型, 内存块)
+    :return: 块类型 -> [成功次数, 失败次数]
+    """
+    slot_types = [block_types[j % len(block_types)] for j in range(ring_size)]
+    stats = {block_type: [0, 0] for block_type in block_types}
 
-    # 启动监控线程并加入管理器
-    monitor_thread = threading.Thread(target=monitor, daemon=True)
-    monitor_thread.name = f"MemoryPoolMonitor-{scene_type.name}"
-    monitor_thread.start()
+    def acquire(i: int, block_type: MemoryBlockType) -> Any:
+        mem = alloc(block_type)
+        if mem:
+            stats[block_type][0] += 1
+        else:
+            stats[block_type][1] += 1
+            if i % 100 == 0:  # 每100次失败打印一次日志
+                logger.warning(f"第{i}次内存分配失败（{block_type.name}）")
+        return mem
 
-    manager = MemoryPoolManager()
-    manager.add_monitor_thread(monitor_thread)
-    logger.debug(f"场景{scene_type.name}监控线程已启动: {monitor_thread.name}")
+    ring = [acquire(j, block_type) for j, block_type in enumerate(slot_types)]
+    for i in range(iterations):
+        j = i % ring_size
+        block_type = slot_types[j]
+        if ring[j]:
+            dealloc(block_type, ring[j])
+        ring[j] = acquire(i, block_type)
+    # 清空环，归还所有在用块
+    for block_type, mem in zip(slot_types, ring):
+        if mem:
+            dealloc(block_type, mem)
+    return stats
 
 def _test_allocation_performance(pool: MemoryPoolConfig, scene_type: SceneType, iterations: int = 1000) -> None:
     """测试内存分配/释放性能（带指标统计）"""
     logger.info(f"开始性能测试：{iterations}次内存分配/释放（场景：{scene_type.name}）")
-    manager = MemoryPoolManager()
-    metrics = manager.get_metrics(scene_type)
+    metrics = MANAGER.get_metrics(scene_type)
 
     if not metrics:
         logger.error("性能指标未找到，跳过性能测试")
         return
 
-    start_time = time.time()
-    for i in range(iterations):
-        # 申请小对象内存
-        mem = pool.allocate(block_type=MemoryBlockType.SMALL)
-        if mem:
-            pool.deallocate(mem)
-            metrics.total_allocations += 1
-            metrics.total_deallocations += 1
+    def pool_alloc(block_type: MemoryBlockType) -> Any:
+        return pool.allocate(block_type=block_type)
+
+    def pool_dealloc(block_type: MemoryBlockType, mem: Any) -> None:
+        pool.deallocate(mem)
+
+    mixed_stats: Optional[Dict[MemoryBlockType, List[int]]] = None
+    freelist_report: Optional[Tuple[int, int, int, int]] = None
+    path_label = "SDK直接调用"
+    start_time = time.perf_counter()
+    if hasattr(pool, 'allocate_batch'):
+        # 批量分配/释放：一次跨越SDK边界，计数器批后一次性累加
+        path_label = "SDK批量接口"
+        mems = pool.allocate_batch(MemoryBlockType.SMALL, iterations)
+        pool.deallocate_batch(mems)
+        metrics.total_allocations += len(mems)
+        metrics.total_deallocations += len(mems)
+        metrics.allocation_failures += iterations - len(mems)
+        if len(mems) < iterations:
+            logger.warning(f"批量分配失败{iterations - len(mems)}次")
+        end_time = time.perf_counter()
+    else:
+        # 环形复用：被测内存池即管理器中注册的内存池时，经线程本地空闲链表复用内存块，
+        # 此时计时反映空闲链表路径而非SDK本身，命中与实际SDK调用次数单独统计
+        use_freelist = MANAGER.get_pool(scene_type) is pool
+        if use_freelist:
+            path_label = "线程本地空闲链表"
+            stats_before = MANAGER.freelist_stats()
+            # partial绑定场景参数，直接调用管理器方法，不额外增加一层Python栈帧
+            alloc = functools.partial(MANAGER.get_block, scene_type)
+            dealloc = functools.partial(MANAGER.return_block, scene_type)
         else:
-            metrics.allocation_failures += 1
-            if i % 100 == 0:  # 每100次失败打印一次日志
-                logger.warning(f"第{i}次内存分配失败")
+            alloc, dealloc = pool_alloc, pool_dealloc
+        succ, fail = _run_ring_pass(alloc, dealloc, (MemoryBlockType.SMALL,),
+                                    _RING_SIZE, iterations)[MemoryBlockType.SMALL]
+        metrics.total_allocations += succ
+        metrics.total_deallocations += succ
+        metrics.allocation_failures += fail
+        end_time = time.perf_counter()
+        if use_freelist:
+            hits, sdk_allocs, sdk_deallocs = (after - before for after, before
+                                              in zip(MANAGER.freelist_stats(), stats_before))
+            flushed = MANAGER.flush_freelists(scene_type)
+            freelist_report = (hits, sdk_allocs, sdk_deallocs, flushed)
+
+        # 第二轮：混合尺寸轮换，直接调用SDK（绕过空闲链表），检测某一尺寸的空闲块被耗尽；
+        # 属诊断性测试，单独计时，不计入性能指标
+        mixed_start = time.perf_counter()
+        mixed_stats = _run_ring_pass(pool_alloc, pool_dealloc,
+                                     _MIXED_BLOCK_TYPES, _MIXED_RING_SIZE, iterations)
+        mixed_elapsed = time.perf_counter() - mixed_start
 
-    end_time = time.time()
     # 输出性能报告
     logger.info("=" * 50)
     logger.info("性能测试报告")
@@ -431,15 +721,26 @@ def _test_allocation_performance(pool: MemoryPoolConfig, scene_type: SceneType,
     logger.info(f"总分配次数: {metrics.total_allocations}")
     logger.info(f"总释放次数: {metrics.total_deallocations}")
     logger.info(f"分配失败次数: {metrics.allocation_failures}")
-    logger.info(f"平均每次分配/释放耗时: {(end_time - start_time)/iterations*1000:.2f}ms")
+    logger.info(f"平均每次分配/释放耗时（{path_label}）: {(end_time - start_time)/iterations*1000:.2f}ms")
+    if freelist_report is not None:
+        hits, sdk_allocs, sdk_deallocs, flushed = freelist_report
+        logger.info(f"空闲链表命中: {hits}次，SDK实际申请: {sdk_allocs}次")
+        logger.info(f"SDK实际归还: {sdk_deallocs}次（超出缓存上限），测试结束后清空空闲链表归还: {flushed}次")
+    if mixed_stats is not None:
+        logger.info("-" * 50)
+        logger.info(f"混合尺寸测试（SDK直接调用）耗时: {mixed_elapsed:.2f}秒，平均每次分配/释放耗时: {mixed_elapsed/iterations*1000:.2f}ms")
+        for block_type, (mixed_succ, mixed_fail) in mixed_stats.items():
+            logger.info(f"混合尺寸测试{block_type.name}块：分配成功{mixed_succ}次，失败{mixed_fail}次")
+            if mixed_fail:
+                logger.warning(f"混合尺寸测试中{block_type.name}块分配失败{mixed_fail}次，可能存在该尺寸空闲块耗尽")
     logger.info("=" * 50)
 
 class MemoryPoolError(Exception):
     """自定义内存池异常（统一异常类型）"""
     pass
 
-# 配置文件示例
-SAMPLE_CONFIG = {
+# 配置文件示例（只读，防止调用方修改常量）
+SAMPLE_CONFIG = types.MappingProxyType({
     "PUBLIC_SERVICE_SCREEN_TOTAL_MEMORY": 536870912,  # 512MB + 32MB
     "PS_LARGE_BLOCK_SIZE": 67108864,  # 64MB + 4MB
     "PS_LARGE_BLOCK_COUNT": 4,
@@ -448,26 +749,52 @@ SAMPLE_CONFIG = {
 
     "VEHICLE_TOTAL_MEMORY": 1073741824,  # 1GB
     "VIRTUAL_IP_TOTAL_MEMORY": 2147483648,  # 2GB
-}
+})
+# 示例配置文件内容在模块加载时编码一次，生成文件时直接写入
+_SAMPLE_CONFIG_BYTES = json.dumps(dict(SAMPLE_CONFIG), indent=2, ensure_ascii=False).encode('utf-8')
+# 示例配置内容摘要，写入旁路.hash文件，内容未变化时跳过重复生成
+_SAMPLE_CONFIG_DIGEST = hashlib.blake2b(_SAMPLE_CONFIG_BYTES).hexdigest()
 
-def create_sample_config() -> None:
-    """生成示例配置文件（便于快速部署）"""
+def create_sample_config(force: bool = True) -> None:
+    """
+    生成示例配置文件（便于快速部署）
+    文件内容已与示例一致时跳过写入
+    :param force: True时覆盖已有配置文件；False时保留已有配置文件，
+                  仅刷新由本函数生成且未被修改（内容摘要与.hash记录一致）的旧示例
+    """
+    config_file = 'memory_pool_config.json'
+    hash_file = config_file + '.hash'
     try:
-        with open('memory_pool_config.json', 'w', encoding='utf-8') as f:
-            json.dump(SAMPLE_CONFIG, f, indent=2, ensure_ascii=False)
-        logger.info("✅ 示例配置文件已生成: memory_pool_config.json")
+        if os.path.exists(config_file):
+            with open(config_file, 'rb') as f:
+                current_digest = hashlib.blake2b(f.read()).hexdigest()
+            if current_digest == _SAMPLE_CONFIG_DIGEST:
+                logger.info(f"示例配置文件已是最新，跳过生成: {config_file}")
+                return
+            recorded_digest = None
+            if not force and os.path.exists(hash_file):
+                with open(hash_file, 'r', encoding='utf-8') as f:
+                    recorded_digest = f.read().strip()
+            if not force and recorded_digest != current_digest:
+                # 非本函数生成或已被修改的配置文件，保留原内容
+                logger.info(f"配置文件已存在，保留现有内容: {config_file}")
+                return
+        with open(config_file, 'wb') as f:
+            f.write(_SAMPLE_CONFIG_BYTES)
+        with open(hash_file, 'w', encoding='utf-8') as f:
+            f.write(_SAMPLE_CONFIG_DIGEST)
+        logger.info(f"✅ 示例配置文件已生成: {config_file}")
     except Exception as e:
         logger.error(f"生成示例配置文件失败: {e}", exc_info=True)
         raise MemoryPoolError(f"配置文件生成失败: {e}")
 
 # 实战调用示例
 if __name__ == "__main__":
+    # 初始化管理器
+    pool_manager = MANAGER
     try:
-        # 生成示例配置文件（首次运行可执行）
-        create_sample_config()
-
-        # 初始化管理器
-        pool_manager = MemoryPoolManager()
+        # 生成示例配置文件（不覆盖已有配置，仅刷新未修改过的旧示例）
+        create_sample_config(force=False)
 
         # 示例1：使用默认配置初始化公共服务屏场景
         logger.info("\n=== 使用默认配置初始化公共服务屏场景 ===")
@@ -488,9 +815,9 @@ if __name__ == "__main__":
         # logger.info("\n=== 初始化虚拟IP场景 ===")
         # virtual_ip_pool = init_scene_memory_pool(SceneType.VIRTUAL_IP)
 
-        # 模拟程序运行（实际业务逻辑）
+        # 模拟程序运行（实际业务逻辑），等待退出事件以便随时中断
         logger.info("\n=== 内存池已就绪，开始执行业务逻辑 ===")
-        time.sleep(10)
+        pool_manager._stop_event.wait(10)
 
     except Exception as e:
         logger.error(f"演示程序执行失败: {e}", exc_info=True)
@@ -498,6 +825,5 @@ if __name__ == "__main__":
     finally:
         # 优雅停止所有监控线程
         logger.info("\n=== 程序退出，清理资源 ===")
-        pool_manager = MemoryPoolManager()
         pool_manager.stop_all_monitors()
         logger.info("✅ 所有资源已清理完成")